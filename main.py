@@ -5,12 +5,24 @@ Synchronizes missing products from Grocy (inventory system) to Mealie
 (meal planning system) shopping list. Runs as a daemon with configurable
 sync intervals.
 """
-from typing import Dict, List
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
 import os
+import re
 import sys
+import tempfile
+import threading
 import time
 import logging
+import math
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from pygrocy2.grocy_api_client import GrocyApiClient
 
 # ------------------------------------------------------------
@@ -33,6 +45,18 @@ MEALIE_API_KEY = os.getenv("MEALIE_API_KEY", "")
 MEALIE_SHOPPING_LIST_ID = os.getenv("MEALIE_SHOPPING_LIST_ID", "")
 
 INTERVAL = int(os.getenv("CHECK_INTERVAL", "600"))  # default = 10 min
+MAX_WORKERS = 8  # upper bound for concurrent Mealie requests per sync
+BULK_CHUNK_SIZE = 500  # max items per Mealie create-bulk request
+# How long a fetched Mealie shopping list is reused before it is re-fetched
+CACHE_TTL = int(os.getenv("MEALIE_CACHE_TTL") or max(60, INTERVAL // 2))
+# Port for the optional POST /grocy-webhook sync trigger (0 = polling only)
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT") or 0)
+# Where the daemon records its last successful API calls, so the separate
+# `main.py health` process can reuse them instead of re-probing
+HEALTH_STATE_FILE = os.getenv(
+    "HEALTH_STATE_FILE",
+    os.path.join(tempfile.gettempdir(), "grocy2mealie-health.json"),
+)
 
 if not all([GROCY_API_URL, GROCY_API_KEY, MEALIE_BASE_URL, MEALIE_API_KEY,
             MEALIE_SHOPPING_LIST_ID]):
@@ -54,50 +78,181 @@ grocy = GrocyApiClient(GROCY_API_URL, GROCY_API_KEY, 9283)
 HEADERS = {
     "Authorization": f"Bearer {MEALIE_API_KEY}",
     "Content-Type": "application/json",
+    # Ask Mealie (or its reverse proxy) for a compressed list payload. urllib3
+    # only lists codings it can decode, so "br" is included once brotli is
+    # installed and the body is decompressed transparently either way.
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
 
-def get_mealie_shopping_list_items(shopping_list_id: str) -> Dict[str, dict]:
+# One pooled keep-alive session for all Mealie calls, so paginated GETs and
+# per-item POSTs don't pay a fresh TCP/TLS handshake each time.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+# One shopping list entry; a tuple instead of a per-item dict keeps large
+# lists compact
+MealieItem = namedtuple("MealieItem", "display food_id item_id")
+
+@lru_cache(maxsize=4096)
+def _normalize(name: str) -> str:
+    """Return the matching key of a name: case-folded, whitespace collapsed."""
+    return " ".join(name.split()).casefold()
+
+# Last fetched shopping list, reused for CACHE_TTL seconds and kept current
+# with items added by this service. etag/last_modified are the validators of
+# a single-page list, used to revalidate it with a conditional GET.
+_CACHE = {"list_id": None, "items": {}, "ts": 0.0, "etag": None, "last_modified": None}
+
+def _invalidate_mealie_cache() -> None:
+    """Force the next get_mealie_shopping_list_items() call to re-fetch."""
+    _CACHE.update(list_id=None, items={}, ts=0.0, etag=None, last_modified=None)
+
+def _fetch_mealie_page(url: str, shopping_list_id: str, page: int,
+                       per_page: int,
+                       headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """
+    Fetch a single page of items on the given shopping list.
+
+    The body is returned undecoded, so concurrently fetched pages are held
+    as compact bytes and only turned into Python objects one at a time
+    (see _decode_mealie_page).
     """
-    Fetches all entries from /api/households/shopping/items (paginated)
-    and filters by shoppingListId.
+    params = {
+        "page": page,
+        "per_page": per_page,
+        "queryFilter": f'shoppingListId="{shopping_list_id}"',
+    }
+    resp = SESSION.get(url, params=params, headers=headers, timeout=10)
+    resp.raise_for_status()
+    return resp
+
+def _decode_mealie_page(resp: requests.Response) -> dict:
+    """
+    Decode a shopping list page with orjson, which parses much faster than
+    the stdlib json used by resp.json().
+
+    Raises:
+        requests.exceptions.InvalidJSONError: The body is not valid JSON,
+            reported like any other failed Mealie request.
+    """
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=resp) from e
+
+def _collect_mealie_items(items: List[dict], shopping_list_id: str,
+                          items_dict: Dict[str, MealieItem]) -> None:
+    """Add the items of one page that belong to shopping_list_id to items_dict."""
+    for it in items:
+        # Mealie filters server-side; this only guards against servers that
+        # ignore queryFilter
+        if it.get("shoppingListId") != shopping_list_id:
+            continue
+        display = (it.get("display") or (it.get("food") or {}).get("name") or "").strip()
+        if not display:
+            continue
+        items_dict[_normalize(display)] = MealieItem(
+            display,
+            it.get("foodId") or (it.get("food") or {}).get("id"),
+            it.get("id"),
+        )
+
+def get_mealie_shopping_list_items(shopping_list_id: str) -> Dict[str, MealieItem]:
+    """
+    Fetches all entries from /api/households/shopping/items (paginated),
+    letting Mealie filter by shoppingListId server-side.
+
+    Once the first page reports the page count, the remaining pages are
+    fetched concurrently. The result is cached for CACHE_TTL seconds per
+    shopping list; after that a single-page list is revalidated with a
+    conditional GET (If-None-Match / If-Modified-Since) and only re-parsed
+    when Mealie reports a change.
 
     Args:
         shopping_list_id: The shopping list ID to filter by.
 
     Returns:
-        Dict mapping display_lower to {display, foodId, itemId}.
+        Dict mapping the case-folded display name to a
+        MealieItem(display, food_id, item_id).
     """
+    if (_CACHE["list_id"] == shopping_list_id
+            and time.monotonic() - _CACHE["ts"] < CACHE_TTL):
+        logger.debug("Mealie: using cached shopping list items.")
+        return _CACHE["items"]
+
     url = f"{MEALIE_BASE_URL}/api/households/shopping/items"
     items_dict = {}
-    page = 1
-    per_page = 200
-
-    while True:
-        params = {"page": page, "per_page": per_page}
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-
-        items = data.get("items", [])
-        for it in items:
-            if it.get("shoppingListId") != shopping_list_id:
-                continue
-            display = (it.get("display") or (it.get("food") or {}).get("name") or "").strip()
-            if not display:
-                continue
-            items_dict[display.lower()] = {
-                "display": display,
-                "foodId": it.get("foodId") or (it.get("food") or {}).get("id"),
-                "itemId": it.get("id")
-            }
+    per_page = 500
 
-        if not data.get("next"):
-            break
-        page += 1
+    conditional = {}
+    if _CACHE["list_id"] == shopping_list_id:
+        if _CACHE["etag"]:
+            conditional["If-None-Match"] = _CACHE["etag"]
+        elif _CACHE["last_modified"]:
+            conditional["If-Modified-Since"] = _CACHE["last_modified"]
 
+    try:
+        resp = _fetch_mealie_page(url, shopping_list_id, 1, per_page, conditional or None)
+        if resp.status_code == 304:
+            _CACHE["ts"] = time.monotonic()
+            _record_ok("mealie")
+            logger.debug("Mealie: shopping list unchanged (304), using cache.")
+            return _CACHE["items"]
+
+        data = _decode_mealie_page(resp)
+        _collect_mealie_items(data.get("items", []), shopping_list_id, items_dict)
+
+        total_pages = data.get("total_pages")
+        if total_pages is None and data.get("total") is not None:
+            total_pages = math.ceil(data["total"] / per_page)
+
+        # Page 1's validators only describe the whole list if it has one page
+        etag = last_modified = None
+        if not data.get("next") and (total_pages or 1) <= 1:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+
+        if total_pages is None:
+            # No page count in the envelope: follow "next" page by page
+            page = 1
+            while data.get("next"):
+                page += 1
+                data = _decode_mealie_page(
+                    _fetch_mealie_page(url, shopping_list_id, page, per_page)
+                )
+                _collect_mealie_items(data.get("items", []), shopping_list_id, items_dict)
+        elif total_pages > 1:
+            # Pages are merged in order so duplicate names resolve as before
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                pages = executor.map(
+                    lambda page: _fetch_mealie_page(url, shopping_list_id, page, per_page),
+                    range(2, total_pages + 1),
+                )
+                for resp in pages:
+                    data = _decode_mealie_page(resp)
+                    _collect_mealie_items(data.get("items", []), shopping_list_id, items_dict)
+    except requests.RequestException:
+        _invalidate_mealie_cache()
+        raise
+    _record_ok("mealie")
+
+    _CACHE.update(list_id=shopping_list_id, items=items_dict, ts=time.monotonic(),
+                  etag=etag, last_modified=last_modified)
     logger.info("Mealie: %d existing shopping list items found.", len(items_dict))
     return items_dict
 
+def _remember_added_item(name: str, shopping_list_id: str) -> None:
+    """Record an item this service added in the cached shopping list."""
+    if _CACHE["list_id"] == shopping_list_id:
+        _CACHE["items"][_normalize(name)] = MealieItem(name, None, None)
+
 def add_to_mealie_shopping_list(item_name: str, shopping_list_id: str,
                                 quantity: float = 1.0) -> bool:
     """
@@ -121,63 +276,171 @@ def add_to_mealie_shopping_list(item_name: str, shopping_list_id: str,
     }
 
     try:
-        resp = requests.post(url, json=payload, headers=HEADERS, timeout=10)
-        if resp.status_code in (200, 201):
-            logger.info("Mealie: added → %s", name)
-            return True
-
-        logger.error("Error during POST (%s): %s", resp.status_code, resp.text)
-        return False
-
+        resp = SESSION.post(url, json=payload, timeout=10)
     except requests.RequestException as e:
+        _invalidate_mealie_cache()
         logger.error("POST error: %s", e)
         return False
 
+    if resp.status_code in (200, 201):
+        logger.info("Mealie: added → %s", name)
+        _remember_added_item(name, shopping_list_id)
+        return True
+
+    logger.error("Error during POST (%s): %s", resp.status_code, resp.text)
+    return False
+
+def add_many_to_mealie_shopping_list(item_names: List[str], shopping_list_id: str,
+                                     quantity: float = 1.0) -> List[bool]:
+    """
+    Add several items to the Mealie shopping list with bulk requests.
+
+    Items are sent to /api/households/shopping/items/create-bulk in chunks
+    of BULK_CHUNK_SIZE, so N items cost one request per chunk instead of N.
+
+    Args:
+        item_names: The names of the items to add, already stripped (as
+            returned by get_understock_products()).
+        shopping_list_id: The shopping list ID.
+        quantity: The quantity of each item (default 1.0).
+
+    Returns:
+        One bool per item name, True if that item was added.
+    """
+    url = f"{MEALIE_BASE_URL}/api/households/shopping/items/create-bulk"
+    base = {"quantity": float(quantity), "shoppingListId": shopping_list_id}
+    results = []
+
+    for start in range(0, len(item_names), BULK_CHUNK_SIZE):
+        chunk = item_names[start:start + BULK_CHUNK_SIZE]
+        payload = [{**base, "note": name} for name in chunk]
+
+        try:
+            resp = SESSION.post(url, json=payload, timeout=10)
+        except requests.RequestException as e:
+            _invalidate_mealie_cache()
+            logger.error("Bulk POST error: %s", e)
+            results.extend([False] * len(chunk))
+            continue
+
+        if resp.status_code not in (200, 201):
+            logger.error("Error during bulk POST (%s): %s", resp.status_code, resp.text)
+            results.extend([False] * len(chunk))
+            continue
+
+        # Mealie reports new rows in createdItems and rows it merged into an
+        # existing entry in updatedItems; without either (or without a JSON
+        # body at all, e.g. an empty 201 from a proxy), trust the status
+        try:
+            data = resp.json()
+        except requests.exceptions.JSONDecodeError:
+            data = None
+        if isinstance(data, dict) and ("createdItems" in data or "updatedItems" in data):
+            stored = {
+                _normalize(it.get("note") or "")
+                for it in data.get("createdItems", []) + data.get("updatedItems", [])
+            }
+        else:
+            stored = {_normalize(name) for name in chunk}
+
+        for name in chunk:
+            ok = _normalize(name) in stored
+            if ok:
+                logger.info("Mealie: added → %s", name)
+                _remember_added_item(name, shopping_list_id)
+            results.append(ok)
+
+    return results
+
 # ------------------------------------------------------------
 # Grocy Helper (corrected)
 # - Uses pygrocy2 missing_products() / volatile stock helpers
 #   instead of own, error-prone product+stock logic
 # ------------------------------------------------------------
-def get_understock_products() -> List[Dict[str, str]]:
+# One understock product; name is stripped, name_key is _normalize(name)
+Product = namedtuple("Product", "id name name_key")
+
+# Last understock result and the Grocy database change time it was read at.
+# Missing products only change with the database, so while that timestamp
+# stays the same the volatile stock doesn't need to be fetched again. The
+# time only has one-second resolution, so a write in the same second as the
+# fetch keeps it unchanged; the result is therefore only reused ("confirmed")
+# once a second fetch has seen the same change time.
+_GROCY_CACHE = {"changed": None, "products": [], "confirmed": False}
+
+def get_understock_products() -> List[Product]:
     """
     Get products that are below minimum stock according to Grocy.
 
     Uses get_volatile_stock() from pygrocy2 and extracts the
-    'missing_products' list.
+    'missing_products' list. The previous result is reused while Grocy's
+    last database change time stays the same as during the last two fetches.
 
     Returns:
-        List of dicts with 'id' and 'name' keys.
+        List of Product tuples; products without a name are skipped
     """
     try:
+        changed = grocy.get_last_db_changed()
+        unchanged = changed is not None and changed == _GROCY_CACHE["changed"]
+        if unchanged and _GROCY_CACHE["confirmed"]:
+            _record_ok("grocy")
+            logger.debug("Grocy: database unchanged, reusing understock products.")
+            return _GROCY_CACHE["products"]
         volatile = grocy.get_volatile_stock()
     except requests.RequestException as e:
         logger.error("Error while requesting Grocy volatile stock: %s", e)
         return []
-
-    products = []
+    _record_ok("grocy")
 
     missing_products = getattr(volatile, "missing_products", []) or []
-    for item in missing_products:
-        name = getattr(item, "name", None)
-        pid = getattr(item, "id", None)
-
-        if name:
-            products.append({
-                "id": pid,
-                "name": name
-            })
+    products = [
+        Product(getattr(item, "id", None), name, _normalize(name))
+        for item in missing_products
+        if (name := (getattr(item, "name", None) or "").strip())
+    ]
 
     logger.info(
         "Grocy: %d products below minimum stock (volatile.missing_products).",
         len(products)
     )
 
+    _GROCY_CACHE.update(changed=changed, products=products, confirmed=unchanged)
     return products
 
 # ------------------------------------------------------------
 # Health Check
 # - Verifies API connectivity and service status
 # ------------------------------------------------------------
+# Wall-clock time of the last successful call per API. time.time() rather
+# than monotonic() because the value is shared with the health process.
+_LAST_OK = {"grocy": 0.0, "mealie": 0.0}
+_LAST_OK_LOCK = threading.Lock()  # Grocy and Mealie are fetched concurrently
+
+def _record_ok(service: str) -> None:
+    """Remember that a sync call to the given API just succeeded."""
+    with _LAST_OK_LOCK:
+        _LAST_OK[service] = time.time()
+        try:
+            tmp_path = f"{HEALTH_STATE_FILE}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(_LAST_OK))
+            os.replace(tmp_path, HEALTH_STATE_FILE)
+        except OSError as e:
+            logger.debug("Could not write health state file: %s", e)
+
+def _load_last_ok() -> Dict[str, float]:
+    """Return the last success times recorded by this or the daemon process."""
+    last_ok = dict(_LAST_OK)
+    try:
+        with open(HEALTH_STATE_FILE, "rb") as f:
+            stored = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return last_ok
+    for service, ts in stored.items():
+        if service in last_ok and isinstance(ts, (int, float)):
+            last_ok[service] = max(last_ok[service], ts)
+    return last_ok
+
 def health_check() -> Dict[str, dict]:
     """
     Check health status of the sync service.
@@ -187,6 +450,9 @@ def health_check() -> Dict[str, dict]:
     - Mealie API is reachable
     - Authentication tokens are valid
 
+    An API that the sync loop reached successfully within the last two
+    intervals is reported reachable without probing it again.
+
     Returns:
         Dict with status and details: {
             "status": "healthy" | "unhealthy",
@@ -200,9 +466,13 @@ def health_check() -> Dict[str, dict]:
         "mealie": {"reachable": False, "error": None},
     }
 
+    last_ok = _load_last_ok()
+    now = time.time()
+
     # Check Grocy connectivity
     try:
-        grocy.get_volatile_stock()
+        if now - last_ok["grocy"] >= 2 * INTERVAL:
+            grocy.get_volatile_stock()
         health["grocy"]["reachable"] = True
         logger.info("✔ Grocy API is reachable")
     except requests.RequestException as e:
@@ -213,11 +483,10 @@ def health_check() -> Dict[str, dict]:
 
     # Check Mealie connectivity
     try:
-        url = f"{MEALIE_BASE_URL}/api/households/shopping/items"
-        resp = requests.get(
-            url, headers=HEADERS, params={"page": 1, "per_page": 1}, timeout=10
-        )
-        resp.raise_for_status()
+        if now - last_ok["mealie"] >= 2 * INTERVAL:
+            url = f"{MEALIE_BASE_URL}/api/households/shopping/items"
+            resp = SESSION.get(url, params={"page": 1, "per_page": 1}, timeout=10)
+            resp.raise_for_status()
         health["mealie"]["reachable"] = True
         logger.info("✔ Mealie API is reachable")
     except requests.RequestException as e:
@@ -228,44 +497,166 @@ def health_check() -> Dict[str, dict]:
 
     return health
 
+# ------------------------------------------------------------
+# Sync Trigger
+# - Optional webhook that wakes the main loop before INTERVAL
+#   has passed, e.g. from a Grocy stock change automation
+# ------------------------------------------------------------
+SYNC_EVENT = threading.Event()
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Sets SYNC_EVENT on POST /grocy-webhook."""
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle a webhook call."""
+        if self.path.split("?")[0].rstrip("/") != "/grocy-webhook":
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        SYNC_EVENT.set()
+        self.send_response(202)
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Route access logs through the service logger."""
+        logger.debug("Webhook: " + format, *args)
+
+def start_webhook_server(port: int) -> ThreadingHTTPServer:
+    """
+    Serve the sync webhook on a background thread.
+
+    Args:
+        port: The TCP port to listen on.
+
+    Returns:
+        The running server.
+    """
+    server = ThreadingHTTPServer(("", port), _WebhookHandler)
+    threading.Thread(target=server.serve_forever, name="webhook", daemon=True).start()
+    logger.info("🔔 Listening for sync webhooks on port %d (POST /grocy-webhook)", port)
+    return server
+
+def wait_for_next_sync() -> None:
+    """
+    Block until the next sync is due.
+
+    Waits INTERVAL seconds, or less if the webhook is enabled and called.
+    """
+    if not WEBHOOK_PORT:
+        time.sleep(INTERVAL)
+        return
+
+    if SYNC_EVENT.wait(timeout=INTERVAL):
+        logger.info("🔔 Sync triggered by webhook.")
+    SYNC_EVENT.clear()
+
 # ------------------------------------------------------------
 # Main Loop
 # ------------------------------------------------------------
+_WORD_RE = re.compile(r"\w+")
+
+def _match_key(key: str) -> str:
+    """Return the words of key joined by single spaces, punctuation dropped."""
+    return " ".join(_WORD_RE.findall(key))
+
+def _phrase_index(keys) -> set:
+    """
+    Return every run of consecutive words of every key.
+
+    "whole wheat bread" yields "whole", "wheat", "bread", "whole wheat",
+    "wheat bread" and "whole wheat bread", so a name is found with one set
+    lookup whether it is a whole entry or whole words inside one. Words are
+    split like _match_key(), so "tomatoes, canned" yields "tomatoes".
+    """
+    phrases = set()
+    for key in keys:
+        words = _WORD_RE.findall(key)
+        for start in range(len(words)):
+            for end in range(start + 1, len(words) + 1):
+                phrases.add(" ".join(words[start:end]))
+    return phrases
+
+def _add_missing_items(mealie_items: Dict[str, MealieItem],
+                       understock: List[Product]) -> bool:
+    """
+    Add understock products that are not on the Mealie list yet.
+
+    Returns:
+        True if nothing was missing, i.e. Mealie was already in sync
+    """
+    # Both sides are normalized at the source; match whole names or
+    # whole words of a longer entry ("wheat bread" in "whole wheat bread")
+    match_keys = [_match_key(p.name_key) for p in understock]
+    missing = set(match_keys) - _phrase_index(mealie_items)
+    queued = set()  # Grocy names that normalize alike are added once
+    to_add = []
+    for item, key in zip(understock, match_keys):
+        if key in queued:
+            logger.info("✔ '%s' is already being added to Mealie.", item.name)
+            continue
+        if key not in missing:
+            logger.info("✔ '%s' already in the Mealie list.", item.name)
+            continue
+        queued.add(key)
+
+        logger.info("➕ '%s' will be added to Mealie…", item.name)
+        to_add.append(item.name)
+
+    # Mealie: add all missing items with as few bulk requests as possible
+    if to_add:
+        results = add_many_to_mealie_shopping_list(
+            to_add, MEALIE_SHOPPING_LIST_ID, quantity=1.0
+        )
+        for name, ok in zip(to_add, results):
+            if not ok:
+                logger.warning("Could not add '%s' to Mealie.", name)
+    return not to_add
+
 def main():
     """
     Main daemon loop that continuously syncs Grocy understock to Mealie.
 
-    Fetches Mealie shopping list items, retrieves understock products from Grocy,
-    and adds missing items to Mealie. Runs in infinite loop with configurable
-    interval between syncs.
+    Fetches Mealie shopping list items while retrieving understock products
+    from Grocy, and adds missing items to Mealie. Runs in infinite loop with configurable
+    interval between syncs, or earlier when the sync webhook is called.
     """
     logger.info("🔄 Grocy → Mealie sync started (using pygrocy missing_products)…")
+    if WEBHOOK_PORT:
+        start_webhook_server(WEBHOOK_PORT)
 
+    last_sync_key = None
+    # Second thread so the Mealie and Grocy fetches overlap each cycle
+    fetcher = ThreadPoolExecutor(max_workers=1)
     while True:
         try:
             # Mealie: load existing shopping list entries (prevents duplicates)
-            mealie_items = get_mealie_shopping_list_items(MEALIE_SHOPPING_LIST_ID)
+            mealie_future = fetcher.submit(
+                get_mealie_shopping_list_items, MEALIE_SHOPPING_LIST_ID
+            )
 
             # Grocy: below-minimum-stock products via pygrocy helper
             understock = get_understock_products()
-            existing_keys = {k.strip().lower() for k in mealie_items}
-            for item in understock:
-                name_key = item.get("name", "").strip().lower()
-                if any(name_key in key for key in existing_keys):
-                    logger.info("✔ '%s' already in the Mealie list.", item['name'])
-                    continue
-
-                logger.info("➕ '%s' will be added to Mealie…", item["name"])
-                ok = add_to_mealie_shopping_list(item["name"], MEALIE_SHOPPING_LIST_ID,
-                                                 quantity=1.0)
-                if not ok:
-                    logger.warning("Could not add '%s' to Mealie.", item["name"])
+            mealie_items = mealie_future.result()
+
+            # Nothing to do if neither side changed since the last sync that
+            # found nothing missing. A key is only remembered once the diff
+            # is empty, never right after an add: an entry removed in Mealie
+            # again (or an add Mealie didn't store) must still be re-added.
+            sync_key = (frozenset(mealie_items), tuple(p.name_key for p in understock))
+            if sync_key == last_sync_key:
+                logger.info("✔ Nothing changed since the last sync.")
+            elif _add_missing_items(mealie_items, understock):
+                last_sync_key = sync_key
 
         except requests.RequestException as e:
             logger.error("❌ API request error in main loop: %s", e)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Keep the daemon alive on unexpected data; retry next interval
+            logger.exception("❌ Unexpected error in main loop")
 
         logger.info("⏳ Waiting %s seconds…\n", INTERVAL)
-        time.sleep(INTERVAL)
+        wait_for_next_sync()
 
 
 if __name__ == "__main__":
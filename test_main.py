@@ -4,9 +4,14 @@ Unit tests for grocy2mealie-sync main module.
 Tests cover:
 - get_mealie_shopping_list_items: pagination, filtering, duplicate key handling
 - add_to_mealie_shopping_list: success, API errors, request exceptions
+- add_many_to_mealie_shopping_list: bulk payload, chunking, per-item results
 - get_understock_products: missing products extraction, error handling
 """
+import json
 import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 import requests
@@ -18,18 +23,30 @@ os.environ.update({
     "MEALIE_API_URL": "http://test-mealie",
     "MEALIE_API_KEY": "test-mealie-key",
     "MEALIE_SHOPPING_LIST_ID": "test-list-id",
+    "HEALTH_STATE_FILE": os.path.join(tempfile.mkdtemp(), "health.json"),
 })
 
 import main
 
+
+def mealie_page(payload):
+    """Build a mocked Mealie GET response whose body is payload as JSON."""
+    response = MagicMock()
+    response.content = json.dumps(payload).encode()
+    response.headers = {}
+    return response
+
 class TestGetMealieShoppingListItems(unittest.TestCase):
     """Tests for get_mealie_shopping_list_items function."""
 
-    @patch("main.requests.get")
+    def setUp(self):
+        """Start every test with an empty shopping list cache."""
+        main._invalidate_mealie_cache()
+
+    @patch("main.SESSION.get")
     def test_single_page_fetch(self, mock_get):
         """Test fetching shopping list with single page."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response = mealie_page({
             "items": [
                 {
                     "id": "item1",
@@ -40,21 +57,22 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
                 }
             ],
             "next": None,
-        }
+        })
         mock_get.return_value = mock_response
 
         result = main.get_mealie_shopping_list_items("test-list-id")
 
         self.assertEqual(len(result), 1)
         self.assertIn("bread", result)
-        self.assertEqual(result["bread"]["display"], "Bread")
-        self.assertEqual(result["bread"]["itemId"], "item1")
+        self.assertEqual(result["bread"].display, "Bread")
+        self.assertEqual(result["bread"].item_id, "item1")
+        self.assertEqual(result["bread"].food_id, "food1")
+        self.assertIsInstance(result["bread"], main.MealieItem)
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     def test_pagination(self, mock_get):
         """Test fetching shopping list with pagination."""
-        page1_response = MagicMock()
-        page1_response.json.return_value = {
+        page1_response = mealie_page({
             "items": [
                 {
                     "id": "item1",
@@ -65,10 +83,9 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
                 }
             ],
             "next": "page2",
-        }
+        })
 
-        page2_response = MagicMock()
-        page2_response.json.return_value = {
+        page2_response = mealie_page({
             "items": [
                 {
                     "id": "item2",
@@ -79,7 +96,7 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
                 }
             ],
             "next": None,
-        }
+        })
 
         mock_get.side_effect = [page1_response, page2_response]
 
@@ -89,11 +106,99 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
         self.assertIn("bread", result)
         self.assertIn("milk", result)
 
-    @patch("main.requests.get")
+    @staticmethod
+    def _paged_responses(pages, envelope_key):
+        """Build a SESSION.get side effect serving pages by their page param."""
+        def fake_get(url, params=None, **kwargs):
+            page = params["page"]
+            count = len(pages)
+            if envelope_key == "total":
+                count *= params["per_page"]
+            return mealie_page({
+                "items": pages[page - 1],
+                envelope_key: count,
+                "next": "more" if page < len(pages) else None,
+            })
+        return fake_get
+
+    @patch("main.SESSION.get")
+    def test_pagination_fetches_remaining_pages_concurrently(self, mock_get):
+        """Test that pages 2..N are requested once total_pages is known."""
+        pages = [
+            [{"id": f"item{n}", "display": name, "shoppingListId": "test-list-id"}]
+            for n, name in enumerate(["Bread", "Milk", "Cheese"], start=1)
+        ]
+        mock_get.side_effect = self._paged_responses(pages, "total_pages")
+
+        result = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(set(result), {"bread", "milk", "cheese"})
+        requested = sorted(c[1]["params"]["page"] for c in mock_get.call_args_list)
+        self.assertEqual(requested, [1, 2, 3])
+
+    @patch("main.SESSION.get")
+    def test_pagination_derives_page_count_from_total(self, mock_get):
+        """Test that the page count falls back to total / per_page."""
+        pages = [
+            [{"id": "item1", "display": "Bread", "shoppingListId": "test-list-id"}],
+            [{"id": "item2", "display": "Milk", "shoppingListId": "test-list-id"}],
+        ]
+        mock_get.side_effect = self._paged_responses(pages, "total")
+
+        result = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(set(result), {"bread", "milk"})
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("main.SESSION.get")
+    def test_pagination_later_pages_win_on_duplicates(self, mock_get):
+        """Test that duplicate names resolve to the entry from the last page."""
+        pages = [
+            [{"id": "item1", "display": "Bread", "shoppingListId": "test-list-id"}],
+            [{"id": "item2", "display": "Bread", "shoppingListId": "test-list-id"}],
+            [{"id": "item3", "display": "bread", "shoppingListId": "test-list-id"}],
+        ]
+        mock_get.side_effect = self._paged_responses(pages, "total_pages")
+
+        result = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(result["bread"].item_id, "item3")
+
+    @patch("main.SESSION.get")
+    def test_pagination_decodes_pages_in_calling_thread(self, mock_get):
+        """Test that concurrently fetched pages are decoded one at a time."""
+        pages = [
+            [{"id": f"item{n}", "display": f"Item {n}", "shoppingListId": "test-list-id"}]
+            for n in range(1, 5)
+        ]
+        mock_get.side_effect = self._paged_responses(pages, "total_pages")
+        decoding_threads = []
+        real_loads = main.orjson.loads
+
+        def recording_loads(content):
+            decoding_threads.append(threading.current_thread())
+            return real_loads(content)
+
+        with patch("main.orjson.loads", side_effect=recording_loads):
+            result = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(len(result), 4)
+        self.assertEqual(decoding_threads, [threading.current_thread()] * 4)
+
+    @patch("main.SESSION.get")
+    def test_invalid_json_raises_request_exception(self, mock_get):
+        """Test that a malformed page is reported as a failed request."""
+        mock_response = MagicMock()
+        mock_response.content = b"<html>Bad Gateway</html>"
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(requests.RequestException):
+            main.get_mealie_shopping_list_items("test-list-id")
+
+    @patch("main.SESSION.get")
     def test_filter_by_shopping_list_id(self, mock_get):
         """Test that items are filtered by shopping list ID."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response = mealie_page({
             "items": [
                 {
                     "id": "item1",
@@ -111,7 +216,7 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
                 },
             ],
             "next": None,
-        }
+        })
         mock_get.return_value = mock_response
 
         result = main.get_mealie_shopping_list_items("test-list-id")
@@ -120,11 +225,10 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
         self.assertIn("bread", result)
         self.assertNotIn("milk", result)
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     def test_case_insensitive_keys(self, mock_get):
         """Test that keys are lowercased for case-insensitive matching."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response = mealie_page({
             "items": [
                 {
                     "id": "item1",
@@ -135,19 +239,43 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
                 }
             ],
             "next": None,
-        }
+        })
         mock_get.return_value = mock_response
 
         result = main.get_mealie_shopping_list_items("test-list-id")
 
         self.assertIn("bread", result)
-        self.assertEqual(result["bread"]["display"], "BREAD")
+        self.assertEqual(result["bread"].display, "BREAD")
+
+    @patch("main.SESSION.get")
+    def test_keys_are_casefolded(self, mock_get):
+        """Test that keys use Unicode case folding and collapse whitespace."""
+        mock_response = mealie_page({
+            "items": [
+                {
+                    "id": "item1",
+                    "display": "STRASSE",
+                    "shoppingListId": "test-list-id",
+                },
+                {
+                    "id": "item2",
+                    "display": "Helles  Weißbier",
+                    "shoppingListId": "test-list-id",
+                },
+            ],
+            "next": None,
+        })
+        mock_get.return_value = mock_response
+
+        result = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertIn("strasse", result)
+        self.assertIn("helles weissbier", result)
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     def test_fallback_to_food_name(self, mock_get):
         """Test fallback to food.name when display is missing."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response = mealie_page({
             "items": [
                 {
                     "id": "item1",
@@ -158,19 +286,19 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
                 }
             ],
             "next": None,
-        }
+        })
         mock_get.return_value = mock_response
 
         result = main.get_mealie_shopping_list_items("test-list-id")
 
         self.assertIn("cheese", result)
-        self.assertEqual(result["cheese"]["display"], "Cheese")
+        self.assertEqual(result["cheese"].display, "Cheese")
+        self.assertEqual(result["cheese"].food_id, "food1")
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     def test_skip_empty_display(self, mock_get):
         """Test that items without display or food name are skipped."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response = mealie_page({
             "items": [
                 {
                     "id": "item1",
@@ -181,7 +309,7 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
                 }
             ],
             "next": None,
-        }
+        })
         mock_get.return_value = mock_response
 
         result = main.get_mealie_shopping_list_items("test-list-id")
@@ -192,7 +320,11 @@ class TestGetMealieShoppingListItems(unittest.TestCase):
 class TestAddToMealieShoppingList(unittest.TestCase):
     """Tests for add_to_mealie_shopping_list function."""
 
-    @patch("main.requests.post")
+    def setUp(self):
+        """Start every test with an empty shopping list cache."""
+        main._invalidate_mealie_cache()
+
+    @patch("main.SESSION.post")
     def test_successful_add_status_200(self, mock_post):
         """Test successful addition with status 200."""
         mock_response = MagicMock()
@@ -208,7 +340,7 @@ class TestAddToMealieShoppingList(unittest.TestCase):
         self.assertEqual(call_kwargs["json"]["quantity"], 1.0)
         self.assertEqual(call_kwargs["json"]["shoppingListId"], "test-list-id")
 
-    @patch("main.requests.post")
+    @patch("main.SESSION.post")
     def test_successful_add_status_201(self, mock_post):
         """Test successful addition with status 201."""
         mock_response = MagicMock()
@@ -219,7 +351,7 @@ class TestAddToMealieShoppingList(unittest.TestCase):
 
         self.assertTrue(result)
 
-    @patch("main.requests.post")
+    @patch("main.SESSION.post")
     def test_api_error_status(self, mock_post):
         """Test handling of API error response."""
         mock_response = MagicMock()
@@ -231,7 +363,7 @@ class TestAddToMealieShoppingList(unittest.TestCase):
 
         self.assertFalse(result)
 
-    @patch("main.requests.post")
+    @patch("main.SESSION.post")
     def test_request_exception(self, mock_post):
         """Test handling of request exception."""
         mock_post.side_effect = requests.RequestException("Connection error")
@@ -240,7 +372,7 @@ class TestAddToMealieShoppingList(unittest.TestCase):
 
         self.assertFalse(result)
 
-    @patch("main.requests.post")
+    @patch("main.SESSION.post")
     def test_custom_quantity(self, mock_post):
         """Test adding item with custom quantity."""
         mock_response = MagicMock()
@@ -255,7 +387,7 @@ class TestAddToMealieShoppingList(unittest.TestCase):
         call_kwargs = mock_post.call_args[1]
         self.assertEqual(call_kwargs["json"]["quantity"], 2.5)
 
-    @patch("main.requests.post")
+    @patch("main.SESSION.post")
     def test_strip_whitespace(self, mock_post):
         """Test that item name is stripped of whitespace."""
         mock_response = MagicMock()
@@ -269,9 +401,304 @@ class TestAddToMealieShoppingList(unittest.TestCase):
         self.assertEqual(call_kwargs["json"]["note"], "Bread")
 
 
+class TestAddManyToMealieShoppingList(unittest.TestCase):
+    """Tests for add_many_to_mealie_shopping_list function."""
+
+    def setUp(self):
+        """Start every test with an empty shopping list cache."""
+        main._invalidate_mealie_cache()
+
+    @patch("main.SESSION.post")
+    def test_sends_single_bulk_request(self, mock_post):
+        """Test that all items go to the create-bulk endpoint in one POST."""
+        mock_post.return_value = MagicMock(status_code=201)
+
+        result = main.add_many_to_mealie_shopping_list(
+            ["Bread", "Milk"], "test-list-id"
+        )
+
+        self.assertEqual(result, [True, True])
+        mock_post.assert_called_once()
+        self.assertTrue(mock_post.call_args[0][0].endswith("/shopping/items/create-bulk"))
+        payload = mock_post.call_args[1]["json"]
+        self.assertIsInstance(payload, list)
+        self.assertEqual(
+            payload,
+            [
+                {"quantity": 1.0, "note": "Bread", "shoppingListId": "test-list-id"},
+                {"quantity": 1.0, "note": "Milk", "shoppingListId": "test-list-id"},
+            ],
+        )
+
+    @patch("main.SESSION.post")
+    def test_per_item_result_from_response(self, mock_post):
+        """Test that created and merged items count as added, others not."""
+        mock_response = MagicMock(status_code=201)
+        mock_response.json.return_value = {
+            "createdItems": [{"note": "Bread"}],
+            "updatedItems": [{"note": "milk"}],
+            "deletedItems": [],
+        }
+        mock_post.return_value = mock_response
+
+        result = main.add_many_to_mealie_shopping_list(
+            ["Bread", "Milk", "Cheese"], "test-list-id"
+        )
+
+        self.assertEqual(result, [True, True, False])
+
+    @patch("main.SESSION.post")
+    def test_non_json_body_trusts_status(self, mock_post):
+        """Test that a 2xx response without a JSON body counts as success."""
+        mock_response = requests.Response()
+        mock_response.status_code = 201
+        mock_response._content = b""
+        mock_post.return_value = mock_response
+        main._CACHE.update(list_id="test-list-id", items={}, ts=time.monotonic())
+
+        result = main.add_many_to_mealie_shopping_list(["Bread", "Milk"], "test-list-id")
+
+        self.assertEqual(result, [True, True])
+        self.assertIn("bread", main._CACHE["items"])
+        self.assertIn("milk", main._CACHE["items"])
+
+    @patch("main.BULK_CHUNK_SIZE", 2)
+    @patch("main.SESSION.post")
+    def test_large_batches_are_chunked(self, mock_post):
+        """Test that batches larger than BULK_CHUNK_SIZE are split."""
+        mock_post.return_value = MagicMock(status_code=201)
+
+        result = main.add_many_to_mealie_shopping_list(
+            ["Bread", "Milk", "Cheese"], "test-list-id"
+        )
+
+        self.assertEqual(result, [True, True, True])
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(len(mock_post.call_args_list[0][1]["json"]), 2)
+        self.assertEqual(len(mock_post.call_args_list[1][1]["json"]), 1)
+
+    @patch("main.SESSION.post")
+    def test_api_error_status(self, mock_post):
+        """Test that an error response marks every item as failed."""
+        mock_post.return_value = MagicMock(status_code=400, text="Bad request")
+
+        result = main.add_many_to_mealie_shopping_list(
+            ["Bread", "Milk"], "test-list-id"
+        )
+
+        self.assertEqual(result, [False, False])
+
+    @patch("main.SESSION.post")
+    def test_request_exception(self, mock_post):
+        """Test that a request exception marks every item as failed."""
+        mock_post.side_effect = requests.RequestException("Connection error")
+
+        result = main.add_many_to_mealie_shopping_list(
+            ["Bread", "Milk"], "test-list-id"
+        )
+
+        self.assertEqual(result, [False, False])
+
+    @patch("main.SESSION.post")
+    @patch("main.SESSION.get")
+    def test_added_items_update_cache(self, mock_get, mock_post):
+        """Test that bulk-added items show up in the cached list."""
+        mock_get.return_value = mealie_page({"items": [], "next": None})
+        mock_post.return_value = MagicMock(status_code=201)
+
+        main.get_mealie_shopping_list_items("test-list-id")
+        main.add_many_to_mealie_shopping_list(["Bread"], "test-list-id")
+        result = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertIn("bread", result)
+
+
+class TestMealieShoppingListCache(unittest.TestCase):
+    """Tests for the Mealie shopping list cache."""
+
+    def setUp(self):
+        """Start every test with an empty shopping list cache."""
+        main._invalidate_mealie_cache()
+
+    @staticmethod
+    def _list_response(next_page=None):
+        return mealie_page({
+            "items": [
+                {
+                    "id": "item1",
+                    "display": "Bread",
+                    "shoppingListId": "test-list-id",
+                    "foodId": "food1",
+                    "food": None,
+                }
+            ],
+            "next": next_page,
+        })
+
+    @patch("main.SESSION.get")
+    def test_second_call_within_ttl_uses_cache(self, mock_get):
+        """Test that a repeated call within the TTL issues no HTTP request."""
+        mock_get.return_value = self._list_response()
+
+        first = main.get_mealie_shopping_list_items("test-list-id")
+        second = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertIs(first, second)
+
+    @patch("main.time.monotonic")
+    @patch("main.SESSION.get")
+    def test_expired_cache_is_refetched(self, mock_get, mock_monotonic):
+        """Test that the list is fetched again once the TTL has passed."""
+        mock_get.return_value = self._list_response()
+        mock_monotonic.return_value = 1000.0
+        main.get_mealie_shopping_list_items("test-list-id")
+
+        mock_monotonic.return_value = 1000.0 + main.CACHE_TTL
+        main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("main.SESSION.get")
+    def test_other_list_is_not_served_from_cache(self, mock_get):
+        """Test that the cache is keyed by shopping list ID."""
+        mock_get.return_value = self._list_response()
+
+        main.get_mealie_shopping_list_items("test-list-id")
+        main.get_mealie_shopping_list_items("other-list-id")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("main.SESSION.post")
+    @patch("main.SESSION.get")
+    def test_successful_add_updates_cache(self, mock_get, mock_post):
+        """Test that an added item shows up in the cached list."""
+        mock_get.return_value = self._list_response()
+        mock_post.return_value = MagicMock(status_code=201)
+
+        main.get_mealie_shopping_list_items("test-list-id")
+        main.add_to_mealie_shopping_list("  Milk ", "test-list-id")
+        result = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertIn("milk", result)
+        self.assertEqual(result["milk"].display, "Milk")
+
+    @patch("main.time.monotonic")
+    @patch("main.SESSION.get")
+    def test_expired_cache_revalidates_with_etag(self, mock_get, mock_monotonic):
+        """Test that a 304 answer to If-None-Match keeps the cached list."""
+        first = self._list_response()
+        first.headers = {"ETag": '"v1"'}
+        not_modified = MagicMock(status_code=304)
+        mock_get.side_effect = [first, not_modified]
+        mock_monotonic.return_value = 1000.0
+        cached = main.get_mealie_shopping_list_items("test-list-id")
+
+        mock_monotonic.return_value = 1000.0 + main.CACHE_TTL
+        result = main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertIs(result, cached)
+        self.assertEqual(mock_get.call_args[1]["headers"], {"If-None-Match": '"v1"'})
+
+    @patch("main.time.monotonic")
+    @patch("main.SESSION.get")
+    def test_expired_cache_falls_back_to_last_modified(self, mock_get, mock_monotonic):
+        """Test that Last-Modified is used when Mealie sends no ETag."""
+        first = self._list_response()
+        first.headers = {"Last-Modified": "Wed, 14 Oct 2026 10:00:00 GMT"}
+        mock_get.side_effect = [first, MagicMock(status_code=304)]
+        mock_monotonic.return_value = 1000.0
+        main.get_mealie_shopping_list_items("test-list-id")
+
+        mock_monotonic.return_value = 1000.0 + main.CACHE_TTL
+        main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(
+            mock_get.call_args[1]["headers"],
+            {"If-Modified-Since": "Wed, 14 Oct 2026 10:00:00 GMT"},
+        )
+
+    @patch("main.time.monotonic")
+    @patch("main.SESSION.get")
+    def test_multi_page_list_is_not_revalidated(self, mock_get, mock_monotonic):
+        """Test that page 1's ETag is ignored when the list spans pages."""
+        page1 = self._list_response(next_page="page2")
+        page1.headers = {"ETag": '"v1"'}
+        page2 = mealie_page({"items": [], "next": None})
+        mock_get.side_effect = [page1, page2, self._list_response()]
+        mock_monotonic.return_value = 1000.0
+        main.get_mealie_shopping_list_items("test-list-id")
+
+        mock_monotonic.return_value = 1000.0 + main.CACHE_TTL
+        main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertIsNone(mock_get.call_args[1]["headers"])
+
+    @patch("main.SESSION.post")
+    @patch("main.SESSION.get")
+    def test_request_exception_invalidates_cache(self, mock_get, mock_post):
+        """Test that a failed request forces a re-fetch on the next call."""
+        mock_get.return_value = self._list_response()
+        mock_post.side_effect = requests.RequestException("Connection error")
+
+        main.get_mealie_shopping_list_items("test-list-id")
+        main.add_to_mealie_shopping_list("Milk", "test-list-id")
+        main.get_mealie_shopping_list_items("test-list-id")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+
 class TestGetUnderstockProducts(unittest.TestCase):
     """Tests for get_understock_products function."""
 
+    def setUp(self):
+        """Start every test with an empty cache and an unknown db change time."""
+        main._GROCY_CACHE.update(changed=None, products=[], confirmed=False)
+        patcher = patch("main.grocy.get_last_db_changed", return_value=None)
+        self.mock_db_changed = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("main.grocy.get_volatile_stock")
+    def test_understock_uses_cache_when_db_unchanged(self, mock_volatile):
+        """Test volatile stock is only re-fetched after the Grocy db changed."""
+        mock_item = MagicMock()
+        mock_item.name = "Bread"
+        mock_item.id = "prod1"
+        mock_volatile.return_value.missing_products = [mock_item]
+        self.mock_db_changed.return_value = "2026-01-01 10:00:00"
+
+        first = main.get_understock_products()
+        second = main.get_understock_products()  # confirms the change time
+        third = main.get_understock_products()
+        self.mock_db_changed.return_value = "2026-01-01 10:05:00"
+        main.get_understock_products()
+
+        self.assertEqual(third, first)
+        self.assertEqual(second, first)
+        self.assertEqual(mock_volatile.call_count, 3)
+
+    @patch("main.grocy.get_volatile_stock")
+    def test_understock_refetches_after_write_in_same_second(self, mock_volatile):
+        """Test a write that didn't move the change time is still picked up."""
+        bread = MagicMock()
+        bread.name = "Bread"
+        milk = MagicMock()
+        milk.name = "Milk"
+        first_stock = MagicMock(missing_products=[bread])
+        second_stock = MagicMock(missing_products=[bread, milk])
+        mock_volatile.side_effect = [first_stock, second_stock]
+        self.mock_db_changed.return_value = "2026-01-01 10:00:00"
+
+        main.get_understock_products()
+        second = main.get_understock_products()
+        third = main.get_understock_products()
+
+        self.assertEqual([p.name for p in second], ["Bread", "Milk"])
+        self.assertEqual(third, second)
+        self.assertEqual(mock_volatile.call_count, 2)
+
     @patch("main.grocy.get_volatile_stock")
     def test_extract_missing_products(self, mock_volatile):
         """Test extraction of missing products from volatile stock."""
@@ -291,14 +718,30 @@ class TestGetUnderstockProducts(unittest.TestCase):
         result = main.get_understock_products()
 
         self.assertEqual(len(result), 2)
-        self.assertEqual(result[0]["name"], "Bread")
-        self.assertEqual(result[0]["id"], "prod1")
-        self.assertEqual(result[1]["name"], "Milk")
-        self.assertEqual(result[1]["id"], "prod2")
+        self.assertEqual(result[0].name, "Bread")
+        self.assertEqual(result[0].id, "prod1")
+        self.assertEqual(result[1].name, "Milk")
+        self.assertEqual(result[1].id, "prod2")
+
+    @patch("main.grocy.get_volatile_stock")
+    def test_name_key_is_stripped_and_casefolded(self, mock_volatile):
+        """Test that names are stripped and carry a normalized matching key."""
+        mock_item = MagicMock()
+        mock_item.name = "  Große  Straße "
+        mock_item.id = "prod1"
+
+        mock_volatile_obj = MagicMock()
+        mock_volatile_obj.missing_products = [mock_item]
+        mock_volatile.return_value = mock_volatile_obj
+
+        result = main.get_understock_products()
+
+        self.assertEqual(result[0].name, "Große  Straße")
+        self.assertEqual(result[0].name_key, "grosse strasse")
 
     @patch("main.grocy.get_volatile_stock")
     def test_skip_items_without_name(self, mock_volatile):
-        """Test that items without name are skipped."""
+        """Test that items without a (non-blank) name are skipped."""
         mock_item1 = MagicMock()
         mock_item1.name = "Bread"
         mock_item1.id = "prod1"
@@ -307,15 +750,19 @@ class TestGetUnderstockProducts(unittest.TestCase):
         mock_item2.name = None
         mock_item2.id = "prod2"
 
+        mock_item3 = MagicMock()
+        mock_item3.name = "   "
+        mock_item3.id = "prod3"
+
         mock_volatile_obj = MagicMock()
-        mock_volatile_obj.missing_products = [mock_item1, mock_item2]
+        mock_volatile_obj.missing_products = [mock_item1, mock_item2, mock_item3]
 
         mock_volatile.return_value = mock_volatile_obj
 
         result = main.get_understock_products()
 
         self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]["name"], "Bread")
+        self.assertEqual(result[0].name, "Bread")
 
     @patch("main.grocy.get_volatile_stock")
     def test_request_exception(self, mock_volatile):
@@ -371,35 +818,35 @@ class TestMainLoop(unittest.TestCase):
         mock_sleep.assert_called_with(main.INTERVAL)
 
     @patch("main.time.sleep")
-    @patch("main.add_to_mealie_shopping_list")
+    @patch("main.add_many_to_mealie_shopping_list")
     @patch("main.get_understock_products")
     @patch("main.get_mealie_shopping_list_items")
     def test_main_loop_adds_missing_item(
         self, mock_mealie_items, mock_understock, mock_add, mock_sleep
     ):
         """Test main loop adds items not in Mealie list."""
-        mock_mealie_items.return_value = {"bread": {"display": "Bread"}}
-        mock_understock.return_value = [{"name": "Milk", "id": "prod1"}]
-        mock_add.return_value = True
+        mock_mealie_items.return_value = {"bread": main.MealieItem("Bread", None, None)}
+        mock_understock.return_value = [main.Product("prod1", "Milk", "milk")]
+        mock_add.return_value = [True]
         mock_sleep.side_effect = KeyboardInterrupt()
 
         with self.assertRaises(KeyboardInterrupt):
             main.main()
 
         mock_add.assert_called_once_with(
-            "Milk", main.MEALIE_SHOPPING_LIST_ID, quantity=1.0
+            ["Milk"], main.MEALIE_SHOPPING_LIST_ID, quantity=1.0
         )
 
     @patch("main.time.sleep")
-    @patch("main.add_to_mealie_shopping_list")
+    @patch("main.add_many_to_mealie_shopping_list")
     @patch("main.get_understock_products")
     @patch("main.get_mealie_shopping_list_items")
     def test_main_loop_skips_existing_items(
         self, mock_mealie_items, mock_understock, mock_add, mock_sleep
     ):
         """Test main loop skips items already in Mealie list."""
-        mock_mealie_items.return_value = {"bread": {"display": "Bread"}}
-        mock_understock.return_value = [{"name": "Bread", "id": "prod1"}]
+        mock_mealie_items.return_value = {"bread": main.MealieItem("Bread", None, None)}
+        mock_understock.return_value = [main.Product("prod1", "Bread", "bread")]
         mock_sleep.side_effect = KeyboardInterrupt()
 
         with self.assertRaises(KeyboardInterrupt):
@@ -408,7 +855,7 @@ class TestMainLoop(unittest.TestCase):
         mock_add.assert_not_called()
 
     @patch("main.time.sleep")
-    @patch("main.add_to_mealie_shopping_list")
+    @patch("main.add_many_to_mealie_shopping_list")
     @patch("main.get_understock_products")
     @patch("main.get_mealie_shopping_list_items")
     def test_main_loop_handles_add_failure(
@@ -416,8 +863,8 @@ class TestMainLoop(unittest.TestCase):
     ):
         """Test main loop handles failed item additions gracefully."""
         mock_mealie_items.return_value = {}
-        mock_understock.return_value = [{"name": "Milk", "id": "prod1"}]
-        mock_add.return_value = False  # Addition failed
+        mock_understock.return_value = [main.Product("prod1", "Milk", "milk")]
+        mock_add.return_value = [False]  # Addition failed
         mock_sleep.side_effect = KeyboardInterrupt()
 
         with self.assertRaises(KeyboardInterrupt):
@@ -442,7 +889,25 @@ class TestMainLoop(unittest.TestCase):
         mock_sleep.assert_called()
 
     @patch("main.time.sleep")
-    @patch("main.add_to_mealie_shopping_list")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_survives_unexpected_errors(
+        self, mock_mealie_items, mock_understock, mock_sleep
+    ):
+        """Test main loop logs non-request errors and keeps running."""
+        mock_mealie_items.return_value = {}
+        mock_understock.side_effect = ValueError("unexpected payload")
+        mock_sleep.side_effect = KeyboardInterrupt()
+
+        with self.assertLogs("grocy-mealie-sync", level="ERROR") as logs:
+            with self.assertRaises(KeyboardInterrupt):
+                main.main()
+
+        self.assertIn("Unexpected error", logs.output[0])
+        mock_sleep.assert_called()
+
+    @patch("main.time.sleep")
+    @patch("main.add_many_to_mealie_shopping_list")
     @patch("main.get_understock_products")
     @patch("main.get_mealie_shopping_list_items")
     def test_main_loop_partial_substring_matching(
@@ -451,9 +916,11 @@ class TestMainLoop(unittest.TestCase):
         """Test main loop skips items with partial substring match in Mealie."""
         # If Mealie has "Whole Wheat Bread" and Grocy has "Bread",
         # the logic checks if grocy item is substring of existing keys
-        mock_mealie_items.return_value = {"whole wheat bread": {"display": "Whole Wheat Bread"}}
+        mock_mealie_items.return_value = {
+            "whole wheat bread": main.MealieItem("Whole Wheat Bread", None, None)
+        }
         mock_understock.return_value = [
-            {"name": "Bread", "id": "prod1"}
+            main.Product("prod1", "Bread", "bread")
         ]
         mock_sleep.side_effect = KeyboardInterrupt()
 
@@ -464,27 +931,260 @@ class TestMainLoop(unittest.TestCase):
         mock_add.assert_not_called()
 
     @patch("main.time.sleep")
-    @patch("main.add_to_mealie_shopping_list")
+    @patch("main.add_many_to_mealie_shopping_list")
     @patch("main.get_understock_products")
     @patch("main.get_mealie_shopping_list_items")
-    def test_main_loop_multiple_items(
+    def test_main_loop_ignores_partial_word_matches(
+        self, mock_mealie_items, mock_understock, mock_add, mock_sleep
+    ):
+        """Test main loop only matches whole words, not fragments of words."""
+        mock_mealie_items.return_value = {"breadcrumbs": main.MealieItem("Breadcrumbs", None, None)}
+        mock_understock.return_value = [main.Product("prod1", "Bread", "bread")]
+        mock_add.return_value = [True]
+        mock_sleep.side_effect = KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            main.main()
+
+        mock_add.assert_called_once_with(
+            ["Bread"], main.MEALIE_SHOPPING_LIST_ID, quantity=1.0
+        )
+
+    @patch("main.time.sleep")
+    @patch("main.add_many_to_mealie_shopping_list")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_matches_words_next_to_punctuation(
+        self, mock_mealie_items, mock_understock, mock_add, mock_sleep
+    ):
+        """Test names match words of entries that contain punctuation."""
+        mock_mealie_items.return_value = {
+            "tomatoes, canned": main.MealieItem("Tomatoes, canned", None, None),
+            "milk, 2%": main.MealieItem("Milk, 2%", None, None),
+        }
+        mock_understock.return_value = [
+            main.Product("prod1", "Tomatoes", "tomatoes"),
+            main.Product("prod2", "Milk 2%", "milk 2%"),
+            main.Product("prod3", "Canned Tomatoes", "canned tomatoes"),
+        ]
+        mock_add.return_value = [True]
+        mock_sleep.side_effect = KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            main.main()
+
+        mock_add.assert_called_once_with(
+            ["Canned Tomatoes"], main.MEALIE_SHOPPING_LIST_ID, quantity=1.0
+        )
+
+    @patch("main.time.sleep")
+    @patch("main.add_many_to_mealie_shopping_list")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_multi_word_matching(
+        self, mock_mealie_items, mock_understock, mock_add, mock_sleep
+    ):
+        """Test multi-word names match consecutive words of a single entry."""
+        mock_mealie_items.return_value = {
+            "whole wheat bread": main.MealieItem("Whole Wheat Bread", None, None),
+            "milk": main.MealieItem("Milk", None, None),
+            "dark chocolate": main.MealieItem("Dark Chocolate", None, None),
+        }
+        mock_understock.return_value = [
+            main.Product("prod1", "Wheat Bread", "wheat bread"),
+            main.Product("prod2", "Chocolate Milk", "chocolate milk"),
+        ]
+        mock_add.return_value = [True]
+        mock_sleep.side_effect = KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            main.main()
+
+        # Words spread over different entries don't count as a match
+        mock_add.assert_called_once_with(
+            ["Chocolate Milk"], main.MEALIE_SHOPPING_LIST_ID, quantity=1.0
+        )
+
+    @patch("main.time.sleep")
+    @patch("main.add_many_to_mealie_shopping_list")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_adds_duplicate_names_once(
         self, mock_mealie_items, mock_understock, mock_add, mock_sleep
     ):
-        """Test main loop processes multiple understock items."""
+        """Test Grocy products with the same normalized name are added once."""
         mock_mealie_items.return_value = {}
         mock_understock.return_value = [
-            {"name": "Bread", "id": "prod1"},
-            {"name": "Milk", "id": "prod2"},
-            {"name": "Cheese", "id": "prod3"},
+            main.Product("prod1", "Milk", "milk"),
+            main.Product("prod2", "MILK", "milk"),
         ]
-        mock_add.return_value = True
+        mock_add.return_value = [True]
+        mock_sleep.side_effect = KeyboardInterrupt()
+
+        with self.assertLogs("grocy-mealie-sync", level="INFO") as logs:
+            with self.assertRaises(KeyboardInterrupt):
+                main.main()
+
+        mock_add.assert_called_once_with(
+            ["Milk"], main.MEALIE_SHOPPING_LIST_ID, quantity=1.0
+        )
+        self.assertTrue(any("'MILK' is already being added" in line for line in logs.output))
+        self.assertFalse(any("'MILK' already in the Mealie list" in line
+                             for line in logs.output))
+
+    @patch("main.time.sleep")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_fetches_both_sides_concurrently(
+        self, mock_mealie_items, mock_understock, mock_sleep
+    ):
+        """Test the Mealie and Grocy fetches are in flight at the same time."""
+        # Each fetch only returns once the other one has started
+        both_started = threading.Barrier(2, timeout=5)
+
+        def fetch_mealie(_list_id):
+            both_started.wait()
+            return {}
+
+        def fetch_grocy():
+            both_started.wait()
+            return []
+
+        mock_mealie_items.side_effect = fetch_mealie
+        mock_understock.side_effect = fetch_grocy
         mock_sleep.side_effect = KeyboardInterrupt()
 
+        with self.assertRaises(KeyboardInterrupt):
+            main.main()
+
+        self.assertFalse(both_started.broken)
+
+    @patch("main.time.sleep")
+    @patch("main.add_many_to_mealie_shopping_list")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_skips_when_unchanged(
+        self, mock_mealie_items, mock_understock, mock_add, mock_sleep
+    ):
+        """Test main loop skips the diff when both sides are unchanged."""
+        mock_mealie_items.return_value = {"milk": main.MealieItem("Milk", None, None)}
+        mock_understock.return_value = [main.Product("prod1", "Milk", "milk")]
+        mock_sleep.side_effect = [None, KeyboardInterrupt()]
+
+        with self.assertLogs("grocy-mealie-sync", level="INFO") as logs:
+            with self.assertRaises(KeyboardInterrupt):
+                main.main()
+
+        self.assertEqual(mock_understock.call_count, 2)
+        self.assertEqual(
+            sum("Nothing changed since the last sync" in line for line in logs.output), 1
+        )
+        mock_add.assert_not_called()
+
+    @patch("main.time.sleep")
+    @patch("main.add_many_to_mealie_shopping_list")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_readds_item_missing_from_mealie(
+        self, mock_mealie_items, mock_understock, mock_add, mock_sleep
+    ):
+        """Test an item Mealie still doesn't show after an add is added again."""
+        # E.g. removed in Mealie right after it was added
+        mock_mealie_items.return_value = {}
+        mock_understock.return_value = [main.Product("prod1", "Milk", "milk")]
+        mock_add.return_value = [True]
+        mock_sleep.side_effect = [None, None, KeyboardInterrupt()]
+
         with self.assertRaises(KeyboardInterrupt):
             main.main()
 
         self.assertEqual(mock_add.call_count, 3)
 
+    @patch("main.time.sleep")
+    @patch("main.add_many_to_mealie_shopping_list")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_retries_unchanged_after_failed_add(
+        self, mock_mealie_items, mock_understock, mock_add, mock_sleep
+    ):
+        """Test an unchanged cycle is not skipped when the last add failed."""
+        mock_mealie_items.return_value = {}
+        mock_understock.return_value = [main.Product("prod1", "Milk", "milk")]
+        mock_add.side_effect = [[False], [True]]
+        mock_sleep.side_effect = [None, KeyboardInterrupt()]
+
+        with self.assertRaises(KeyboardInterrupt):
+            main.main()
+
+        self.assertEqual(mock_add.call_count, 2)
+
+    @patch("main.time.sleep")
+    @patch("main.add_many_to_mealie_shopping_list")
+    @patch("main.get_understock_products")
+    @patch("main.get_mealie_shopping_list_items")
+    def test_main_loop_multiple_items(
+        self, mock_mealie_items, mock_understock, mock_add, mock_sleep
+    ):
+        """Test main loop adds multiple understock items in one batch."""
+        mock_mealie_items.return_value = {}
+        mock_understock.return_value = [
+            main.Product("prod1", "Bread", "bread"),
+            main.Product("prod2", "Milk", "milk"),
+            main.Product("prod3", "Cheese", "cheese"),
+        ]
+        mock_add.return_value = [True, True, True]
+        mock_sleep.side_effect = KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            main.main()
+
+        mock_add.assert_called_once_with(
+            ["Bread", "Milk", "Cheese"], main.MEALIE_SHOPPING_LIST_ID, quantity=1.0
+        )
+
+
+class TestSyncTrigger(unittest.TestCase):
+    """Tests for the webhook sync trigger."""
+
+    def setUp(self):
+        """Start every test without a pending trigger."""
+        main.SYNC_EVENT.clear()
+
+    @patch("main.WEBHOOK_PORT", 0)
+    @patch("main.time.sleep")
+    def test_polls_when_webhook_disabled(self, mock_sleep):
+        """Test that the loop sleeps the full interval without a webhook."""
+        main.wait_for_next_sync()
+
+        mock_sleep.assert_called_once_with(main.INTERVAL)
+
+    @patch("main.WEBHOOK_PORT", 8080)
+    @patch("main.INTERVAL", 5)
+    def test_trigger_wakes_wait_early(self):
+        """Test that a pending trigger ends the wait immediately."""
+        main.SYNC_EVENT.set()
+        start = time.monotonic()
+
+        main.wait_for_next_sync()
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertFalse(main.SYNC_EVENT.is_set())
+
+    def test_webhook_sets_sync_event(self):
+        """Test that POST /grocy-webhook triggers a sync."""
+        server = main.start_webhook_server(0)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        missing = requests.post(f"{url}/other", timeout=5)
+        self.assertEqual(missing.status_code, 404)
+        self.assertFalse(main.SYNC_EVENT.is_set())
+
+        resp = requests.post(f"{url}/grocy-webhook", timeout=5)
+        self.assertEqual(resp.status_code, 202)
+        self.assertTrue(main.SYNC_EVENT.is_set())
+
 
 class TestEnvironmentVariables(unittest.TestCase):
     """Tests for environment variable handling."""
@@ -513,17 +1213,44 @@ class TestEnvironmentVariables(unittest.TestCase):
         self.assertIn("Content-Type", main.HEADERS)
         self.assertEqual(main.HEADERS["Content-Type"], "application/json")
 
+    def test_headers_accept_compression(self):
+        """Test that Mealie responses are requested gzip/brotli compressed."""
+        encodings = main.HEADERS["Accept-Encoding"].split(",")
+        self.assertIn("gzip", encodings)
+        self.assertIn("br", encodings)
+        self.assertEqual(
+            main.SESSION.headers["Accept-Encoding"], main.HEADERS["Accept-Encoding"]
+        )
+
+    def test_session_carries_headers(self):
+        """Test that the shared SESSION sends the Mealie headers."""
+        for key, value in main.HEADERS.items():
+            self.assertEqual(main.SESSION.headers[key], value)
+
+    def test_session_mounts_pooled_adapter(self):
+        """Test that the shared SESSION uses a pooled adapter with retries."""
+        adapter = main.SESSION.get_adapter("https://test-mealie")
+        self.assertIs(adapter, main.SESSION.get_adapter("http://test-mealie"))
+        self.assertEqual(adapter.max_retries.total, 3)
+
 
 class TestIntegrationScenarios(unittest.TestCase):
     """Integration tests for realistic scenarios."""
 
-    @patch("main.requests.post")
-    @patch("main.requests.get")
+    def setUp(self):
+        """Start every test with empty shopping list and understock caches."""
+        main._invalidate_mealie_cache()
+        main._GROCY_CACHE.update(changed=None, products=[], confirmed=False)
+        patcher = patch("main.grocy.get_last_db_changed", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("main.SESSION.post")
+    @patch("main.SESSION.get")
     def test_sync_cycle_with_real_responses(self, mock_get, mock_post):
         """Test complete sync cycle with realistic API responses."""
         # Mock Mealie GET response
-        mealie_response = MagicMock()
-        mealie_response.json.return_value = {
+        mealie_response = mealie_page({
             "items": [
                 {
                     "id": "item1",
@@ -541,7 +1268,7 @@ class TestIntegrationScenarios(unittest.TestCase):
                 },
             ],
             "next": None,
-        }
+        })
         mock_get.return_value = mealie_response
 
         # Mock Mealie POST response
@@ -575,11 +1302,11 @@ class TestIntegrationScenarios(unittest.TestCase):
         result = main.get_understock_products()
 
         self.assertEqual(len(result), 2)
-        names = [item["name"] for item in result]
+        names = [item.name for item in result]
         self.assertIn("Low Stock Item", names)
         self.assertIn("Another Item", names)
 
-    @patch("main.requests.post")
+    @patch("main.SESSION.post")
     def test_mealie_post_with_payload_validation(self, mock_post):
         """Test POST payload structure matches Mealie API requirements."""
         mock_response = MagicMock()
@@ -600,11 +1327,10 @@ class TestIntegrationScenarios(unittest.TestCase):
         self.assertEqual(payload["note"], "Test Item")
         self.assertEqual(payload["shoppingListId"], "list-123")
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     def test_mealie_pagination_parameters(self, mock_get):
         """Test pagination parameters sent to Mealie API."""
-        response = MagicMock()
-        response.json.return_value = {"items": [], "next": None}
+        response = mealie_page({"items": [], "next": None})
         mock_get.return_value = response
 
         main.get_mealie_shopping_list_items("list-id")
@@ -612,13 +1338,60 @@ class TestIntegrationScenarios(unittest.TestCase):
         # Verify correct pagination parameters
         call_kwargs = mock_get.call_args[1]
         self.assertEqual(call_kwargs["params"]["page"], 1)
-        self.assertEqual(call_kwargs["params"]["per_page"], 200)
+        self.assertEqual(call_kwargs["params"]["per_page"], 500)
+
+    @patch("main.SESSION.get")
+    def test_mealie_get_filters_by_shopping_list_server_side(self, mock_get):
+        """Test that the shopping list filter is sent to the Mealie API."""
+        response = mealie_page({"items": [], "next": None})
+        mock_get.return_value = response
+
+        main.get_mealie_shopping_list_items("list-id")
+
+        call_kwargs = mock_get.call_args[1]
+        self.assertEqual(
+            call_kwargs["params"]["queryFilter"], 'shoppingListId="list-id"'
+        )
 
 
 class TestHealthCheck(unittest.TestCase):
     """Tests for health_check function."""
 
-    @patch("main.requests.get")
+    def setUp(self):
+        main._LAST_OK.update(grocy=0.0, mealie=0.0)
+        if os.path.exists(main.HEALTH_STATE_FILE):
+            os.remove(main.HEALTH_STATE_FILE)
+
+    @patch("main.SESSION.get")
+    @patch("main.grocy.get_volatile_stock")
+    def test_health_check_reuses_recent_sync(self, mock_volatile, mock_get):
+        """Test that APIs reached by a recent sync are not probed again."""
+        main._record_ok("grocy")
+        main._record_ok("mealie")
+        main._LAST_OK.update(grocy=0.0, mealie=0.0)  # only the state file is left
+
+        result = main.health_check()
+
+        self.assertEqual(result["status"], "healthy")
+        mock_volatile.assert_not_called()
+        mock_get.assert_not_called()
+
+    @patch("main.SESSION.get")
+    @patch("main.grocy.get_volatile_stock")
+    def test_health_check_probes_when_stale(self, mock_volatile, mock_get):
+        """Test that an API without a recent successful sync is probed."""
+        main._record_ok("mealie")
+        main._LAST_OK["grocy"] = time.time() - 2 * main.INTERVAL - 1
+        mock_volatile.side_effect = requests.RequestException("Connection refused")
+
+        result = main.health_check()
+
+        self.assertEqual(result["status"], "unhealthy")
+        self.assertFalse(result["grocy"]["reachable"])
+        mock_volatile.assert_called_once()
+        mock_get.assert_not_called()
+
+    @patch("main.SESSION.get")
     @patch("main.grocy.get_volatile_stock")
     def test_health_check_all_healthy(self, mock_volatile, mock_get):
         """Test health check when all services are healthy."""
@@ -638,7 +1411,7 @@ class TestHealthCheck(unittest.TestCase):
         self.assertTrue(result["mealie"]["reachable"])
         self.assertIsNone(result["mealie"]["error"])
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     @patch("main.grocy.get_volatile_stock")
     def test_health_check_grocy_unreachable(self, mock_volatile, mock_get):
         """Test health check when Grocy is unreachable."""
@@ -655,7 +1428,7 @@ class TestHealthCheck(unittest.TestCase):
         self.assertIsNotNone(result["grocy"]["error"])
         self.assertTrue(result["mealie"]["reachable"])
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     @patch("main.grocy.get_volatile_stock")
     def test_health_check_mealie_unreachable(self, mock_volatile, mock_get):
         """Test health check when Mealie is unreachable."""
@@ -672,7 +1445,7 @@ class TestHealthCheck(unittest.TestCase):
         self.assertFalse(result["mealie"]["reachable"])
         self.assertIsNotNone(result["mealie"]["error"])
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     @patch("main.grocy.get_volatile_stock")
     def test_health_check_both_unreachable(self, mock_volatile, mock_get):
         """Test health check when both services are unreachable."""
@@ -685,7 +1458,7 @@ class TestHealthCheck(unittest.TestCase):
         self.assertFalse(result["grocy"]["reachable"])
         self.assertFalse(result["mealie"]["reachable"])
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     @patch("main.grocy.get_volatile_stock")
     def test_health_check_grocy_exception(self, mock_volatile, mock_get):
         """Test health check handles Grocy request exceptions."""
@@ -701,7 +1474,7 @@ class TestHealthCheck(unittest.TestCase):
         self.assertFalse(result["grocy"]["reachable"])
         self.assertIn("Network error", result["grocy"]["error"])
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     @patch("main.grocy.get_volatile_stock")
     def test_health_check_mealie_exception(self, mock_volatile, mock_get):
         """Test health check handles Mealie request exceptions."""
@@ -718,7 +1491,7 @@ class TestHealthCheck(unittest.TestCase):
         self.assertFalse(result["mealie"]["reachable"])
         self.assertIn("Network timeout", result["mealie"]["error"])
 
-    @patch("main.requests.get")
+    @patch("main.SESSION.get")
     @patch("main.grocy.get_volatile_stock")
     def test_health_check_mealie_api_error(self, mock_volatile, mock_get):
         """Test health check handles Mealie API errors."""